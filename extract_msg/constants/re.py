@@ -7,6 +7,8 @@ __all__ = [
     'HTML_SAN_SPACE',
     'INVALID_FILENAME_CHARS',
     'INVALID_OLE_PATH',
+    'RECIPIENT_FOLDING',
+    'RECIPIENT_WHITESPACE',
     'RTF_ENC_BODY_START',
 ]
 
@@ -27,3 +29,9 @@ RTF_ENC_BODY_START = re.compile(br'\{\\\*\\htmltag[0-9]* ?<body[^>]*>\}')
 # invalid.
 INVALID_OLE_PATH = re.compile(r'[:/\\!]')
 
+# Used to collapse runs of whitespace (including folded lines) in recipient
+# fields into a single space.
+RECIPIENT_WHITESPACE = re.compile(r'[ \t\r\n]+')
+# Used to join folded lines in recipient fields and collapse runs of spaces.
+# Tabs are only matched as part of a folded line break.
+RECIPIENT_FOLDING = re.compile(r'(?:\r\n\t| |\r|\n)+')
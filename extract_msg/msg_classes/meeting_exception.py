@@ -4,13 +4,13 @@ __all__ = [
 
 
 import datetime
-import functools
 
 from typing import Optional
 
 from .. import constants
 from ..enums import SaveType
 from .meeting_related import MeetingRelated
+from ..utils import _cachedProperty
 
 
 class MeetingException(MeetingRelated):
@@ -29,7 +29,7 @@ class MeetingException(MeetingRelated):
         """
         return (SaveType.NONE, None)
 
-    @functools.cached_property
+    @_cachedProperty
     def exceptionReplaceTime(self) -> Optional[datetime.datetime]:
         """
         The date and time within the recurrence pattern that the exception will
@@ -37,7 +37,7 @@ class MeetingException(MeetingRelated):
         """
         return self._getNamedAs('8228', constants.ps.PSETID_APPOINTMENT)
 
-    @functools.cached_property
+    @_cachedProperty
     def fExceptionalBody(self) -> bool:
         """
         Indicates that the Exception Embedded Message object has a body that
@@ -46,7 +46,7 @@ class MeetingException(MeetingRelated):
         """
         return self._getNamedAs('8206', constants.ps.PSETID_APPOINTMENT, bool, False)
 
-    @functools.cached_property
+    @_cachedProperty
     def fInvited(self) -> bool:
         """
         Indicates if invitations have been sent for this exception.
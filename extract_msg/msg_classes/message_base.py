@@ -119,11 +119,12 @@ class MessageBase(MSGFile):
                 pass
             raise
 
-    def _genRecipient(self, recipientType, recipientInt : RecipientType) -> Optional[str]:
+    def _genRecipient(self, recipientType : str, recipientInt : Union[int, RecipientType]) -> Optional[str]:
         """
         Returns the specified recipient field.
         """
-        recipientInt = RecipientType(recipientInt)
+        if not isinstance(recipientInt, RecipientType):
+            recipientInt = RecipientType(recipientInt)
         value = None
         # Check header first.
         if self.headerInit:
@@ -140,22 +141,18 @@ class MessageBase(MSGFile):
                 logger.info(f'Header found, but "{recipientType}" is not included. Will be generated from other streams.')
 
             # Get a list of the recipients of the specified type.
-            foundRecipients = tuple(recipient.formatted for recipient in self.recipients if recipient.type == recipientInt)
+            # Enum members are singletons, so identity is enough here.
+            foundRecipients = [recipient.formatted for recipient in self.recipients if recipient.type is recipientInt]
 
             # If we found recipients, join them with the recipient separator
             # and a space.
-            if len(foundRecipients) > 0:
+            if foundRecipients:
                 value = (self.__recipientSeparator + ' ').join(foundRecipients)
 
-        # Code to fix the formatting so it's all a single line. This allows
-        # the user to format it themself if they want. This should probably
-        # be redone to use re or something, but I can do that later. This
-        # shouldn't be a huge problem for now.
+        # Fix the formatting so it's all a single line. This allows the user to
+        # format it themself if they want.
         if value:
-            value = value.replace(' \r\n\t', ' ').replace('\r\n\t ', ' ').replace('\r\n\t', ' ')
-            value = value.replace('\r\n', ' ').replace('\r', ' ').replace('\n', ' ')
-            while value.find('  ') != -1:
-                value = value.replace('  ', ' ')
+            value = constants.re.RECIPIENT_FOLDING.sub(' ', value)
 
         return value
 
@@ -13,6 +13,7 @@ __all__ = [
 import copy
 import logging
 import pprint
+import sys
 
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING, Union
 
@@ -51,6 +52,9 @@ class Named:
         entryStreamLength = len(entryStream) if entryStream else 0
 
         self.__propertiesDict = {}
+        # Maps the upper case version of each key to the property, allowing
+        # case insensitive lookups without scanning every key.
+        self.__propertiesDictUpper = {}
         self.__properties = []
         self.__guids = tuple()
         self.__names = {}
@@ -81,7 +85,23 @@ class Named:
                 name = property.name if isinstance(property, StringNamedProperty) else property.propertyID
                 self.__propertiesDict[(name, property.guid)] = property
 
+            # Build the case insensitive index after the main dict so that it
+            # matches the first key found when iterating. The name or ID part of
+            # each key is interned, so a lookup using an identifier-like string
+            # literal (which the compiler also interns) matches it by identity.
+            # The GUID part is still compared by value.
+            for key, property in self.__propertiesDict.items():
+                # Malformed entries can have a GUID index of 0, which gives them
+                # a GUID of None. Leave those out of the index rather than
+                # failing to load the named properties at all.
+                if key[0] is None or key[1] is None:
+                    continue
+                self.__propertiesDictUpper.setdefault((sys.intern(key[0].upper()), key[1].upper()), property)
+
     def __contains__(self, key) -> bool:
+        # Use the same case insensitive matching as __getitem__ for valid keys.
+        if isinstance(key, tuple) and len(key) == 2 and isinstance(key[0], str) and isinstance(key[1], str):
+            return (key[0].upper(), key[1].upper()) in self.__propertiesDictUpper
         return key in self.__propertiesDict
 
     def __getitem__(self, propertyName : Tuple[str, str]):
@@ -89,13 +109,12 @@ class Named:
         if not hasattr(propertyName, '__len__') or len(propertyName) != 2:
             raise TypeError('Named property key must be a tuple of two strings.')
 
-        # Case insensitive search of the dictionary.
+        # Most keys are passed already in upper case, so try them as is before
+        # doing a case insensitive search of the dictionary.
+        if (property := self.__propertiesDictUpper.get(tuple(propertyName))) is not None:
+            return property
         propertyName = (propertyName[0].upper(), propertyName[1].upper())
-        for key in self.__propertiesDict.keys():
-             if propertyName == (key[0].upper(), key[1].upper()):
-                    return self.__propertiesDict[key]
-
-        raise KeyError(propertyName)
+        return self.__propertiesDictUpper[propertyName]
 
     def __iter__(self):
         return self.__propertiesDict.__iter__()
@@ -57,6 +57,7 @@ import datetime
 import email.header
 import email.message
 import email.policy
+import functools
 import glob
 import json
 import logging
@@ -73,7 +74,10 @@ import olefile
 import tzlocal
 
 from html import escape as htmlEscape
-from typing import Any, Dict, List, Optional, TypeVar, TYPE_CHECKING, Union
+from typing import (
+        Any, Callable, Dict, Generic, List, Optional, overload, Type, TypeVar,
+        TYPE_CHECKING, Union
+    )
 
 from . import constants
 from .enums import AttachmentType
@@ -85,6 +89,8 @@ from .exceptions import (
 
 # Allow for nice type checking.
 if TYPE_CHECKING:
+    from typing_extensions import Self
+
     from .msg_classes.msg import MSGFile
 
 logger = logging.getLogger(__name__)
@@ -94,6 +100,33 @@ logging.addLevelName(5, 'DEVELOPER')
 _T = TypeVar("_T")
 
 
+class _cachedProperty(functools.cached_property, Generic[_T]):
+    """
+    A lighter version of functools.cached_property. The value is computed on
+    first access and written into the instance's __dict__, which then shadows
+    this descriptor for all future accesses. Unlike the functools version, no
+    lock is acquired, as none of the classes using this are meant to be shared
+    between threads during parsing. It subclasses the functools version so
+    that it can override, and be overridden by, properties using it.
+    """
+    def __init__(self, func : Callable[[Any], _T]):
+        super().__init__(func)
+
+    @overload
+    def __get__(self, instance : None, owner : Optional[Type[Any]] = None) -> Self: ...
+
+    @overload
+    def __get__(self, instance : object, owner : Optional[Type[Any]] = None) -> _T: ...
+
+    def __get__(self, instance, owner = None):
+        if instance is None:
+            return self
+        if self.attrname is None:
+            raise TypeError('Cannot use _cachedProperty instance without calling __set_name__ on it.')
+        value = instance.__dict__[self.attrname] = self.func(instance)
+        return value
+
+
 def addNumToDir(dirName : pathlib.Path) -> Optional[pathlib.Path]:
     """
     Attempt to create the directory with a '(n)' appended.
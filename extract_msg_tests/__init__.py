@@ -1,6 +1,13 @@
 __all__ = [
+    'CachedPropertyTests',
+    'CalendarGenRecipientTests',
+    'MessageGenRecipientTests',
+    'NamedTests',
     'OleWriterEditingTests',
     'OleWriterExportTests',
 ]
 
+from .gen_recipient_tests import CalendarGenRecipientTests, MessageGenRecipientTests
+from .named_tests import NamedTests
 from .ole_writer_tests import OleWriterEditingTests, OleWriterExportTests
+from .utils_tests import CachedPropertyTests
@@ -0,0 +1,111 @@
+__all__ = [
+    'CalendarGenRecipientTests',
+    'MessageGenRecipientTests',
+]
+
+
+import types
+import unittest
+
+from extract_msg.enums import MeetingRecipientType, RecipientType
+from extract_msg.msg_classes import CalendarBase, MessageBase
+
+
+class CalendarGenRecipientTests(unittest.TestCase):
+    def _genRecipient(self, headerValue, recipients = None):
+        """
+        Calls CalendarBase._genRecipient on a minimal stand in for a calendar
+        object, using the specified value for the "to" header field and the
+        specified list of formatted required attendees.
+        """
+        source = types.SimpleNamespace(
+            headerInit = True,
+            header = {'to': headerValue},
+            recipientSeparator = ';',
+            _recipientsByType = {},
+        )
+        if recipients:
+            source._recipientsByType[MeetingRecipientType.SENDABLE_REQUIRED_ATTENDEE] = recipients
+
+        return CalendarBase._genRecipient(source, 'to', MeetingRecipientType.SENDABLE_REQUIRED_ATTENDEE)
+
+    def testFoldedLines(self):
+        """
+        Tests that folded lines in the header are joined into a single line.
+        """
+        self.assertEqual(self._genRecipient('A <a@example.com>,\r\n\tB <b@example.com>'), 'A <a@example.com>; B <b@example.com>')
+        self.assertEqual(self._genRecipient('A <a@example.com>,\r\n B <b@example.com>'), 'A <a@example.com>; B <b@example.com>')
+
+    def testTabs(self):
+        """
+        Tests that runs of tabs and spaces are collapsed to a single space.
+        """
+        self.assertEqual(self._genRecipient('A\t\t <a@example.com>'), 'A <a@example.com>')
+
+    def testNonBreakingSpace(self):
+        """
+        Tests that whitespace outside of spaces, tabs, and line breaks is left
+        alone.
+        """
+        self.assertEqual(self._genRecipient('\xa0A\xa0B '), '\xa0A\xa0B')
+
+    def testStrip(self):
+        """
+        Tests that leading and trailing whitespace is removed.
+        """
+        self.assertEqual(self._genRecipient('  A <a@example.com>\r\n'), 'A <a@example.com>')
+
+    def testBlankHeader(self):
+        """
+        Tests that a blank header field, or one that is only whitespace, falls
+        back to the recipients and returns None if there are none.
+        """
+        for headerValue in (None, '', ' \r\n\t '):
+            with self.subTest(headerValue = headerValue):
+                self.assertIsNone(self._genRecipient(headerValue))
+                self.assertEqual(self._genRecipient(headerValue, ['A <a@example.com>', 'B\r\n <b@example.com>']), 'A <a@example.com>; B <b@example.com>')
+
+
+class MessageGenRecipientTests(unittest.TestCase):
+    def _genRecipient(self, headerValue, recipients = None):
+        """
+        Calls MessageBase._genRecipient on a minimal stand in for a message,
+        using the specified value for the "to" header field and the specified
+        list of formatted "to" recipients.
+        """
+        source = types.SimpleNamespace(
+            headerInit = True,
+            header = {'to': headerValue},
+            _MessageBase__recipientSeparator = ';',
+            recipients = [
+                types.SimpleNamespace(type = RecipientType.TO, formatted = recipient)
+                for recipient in (recipients or ())
+            ],
+        )
+
+        return MessageBase._genRecipient(source, 'to', RecipientType.TO)
+
+    def testFoldedLines(self):
+        """
+        Tests that line breaks are replaced and runs of spaces collapsed.
+        """
+        self.assertEqual(self._genRecipient('A <a@example.com>,\n  B <b@example.com>'), 'A <a@example.com>; B <b@example.com>')
+        self.assertEqual(self._genRecipient('A', ['A\r\n\t<a@example.com>', 'B\r <b@example.com>']), 'A')
+        self.assertEqual(self._genRecipient(None, ['A\r\n\t<a@example.com>', 'B\r <b@example.com>']), 'A <a@example.com>; B <b@example.com>')
+
+    def testOtherWhitespace(self):
+        """
+        Tests that tabs outside of folded lines are left alone and that leading
+        and trailing spaces are only collapsed, not removed.
+        """
+        self.assertEqual(self._genRecipient('  x\t y  '), ' x\t y ')
+        self.assertEqual(self._genRecipient('A\xa0B'), 'A\xa0B')
+
+    def testBlankHeader(self):
+        """
+        Tests that a blank header field falls back to the recipients and is
+        returned as is if there are none.
+        """
+        self.assertEqual(self._genRecipient(''), '')
+        self.assertIsNone(self._genRecipient(None))
+        self.assertEqual(self._genRecipient('', ['A <a@example.com>']), 'A <a@example.com>')
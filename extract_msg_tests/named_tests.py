@@ -0,0 +1,110 @@
+__all__ = [
+    'NamedTests',
+]
+
+
+import unittest
+
+from extract_msg import constants
+from extract_msg.properties.named import Named
+
+
+class _NamedSource:
+    """
+    Minimal stand in for an MSGFile that only provides the named property
+    streams.
+    """
+    def __init__(self, streams):
+        self.streams = streams
+
+    def _getStream(self, filename, prefix = True):
+        return self.streams.get(filename[1])
+
+
+def _names(*names : str) -> bytes:
+    """
+    Creates a names stream, padding each entry to a multiple of 4 bytes.
+    """
+    data = b''
+    for name in names:
+        encoded = name.encode('utf-16-le')
+        data += constants.st.STNP_NAM.pack(len(encoded)) + encoded
+        data += b'\x00' * (-len(data) % 4)
+
+    return data
+
+
+def _entry(_id : int, guidIndex : int, string : bool, pid : int) -> bytes:
+    """
+    Creates a single entry for the entry stream.
+    """
+    return constants.st.STNP_ENT.pack(_id, guidIndex << 1 | string, pid)
+
+
+class NamedTests(unittest.TestCase):
+    def _setupNamed(self) -> Named:
+        """
+        Sets up a Named instance with a numerical property, two string
+        properties whose names only differ by case, and a property with an
+        invalid GUID index.
+        """
+        entries = (
+            _entry(0x8001, 1, False, 0),
+            # Offset of "Keywords" in the names stream.
+            _entry(0, 2, True, 1),
+            # Offset of "KEYWORDS" in the names stream.
+            _entry(20, 2, True, 2),
+            # GUID index 0 is invalid, giving a GUID of None.
+            _entry(0x8002, 0, False, 3),
+        )
+        self.source = _NamedSource({
+            '__substg1.0_00020102': b'',
+            '__substg1.0_00030102': b''.join(entries),
+            '__substg1.0_00040102': _names('Keywords', 'KEYWORDS'),
+        })
+
+        return Named(self.source)
+
+    def testSetup(self):
+        """
+        Checks that an entry with a GUID of None does not stop the named
+        properties from loading.
+        """
+        named = self._setupNamed()
+        self.assertEqual(len(named), 4)
+
+    def testExactLookup(self):
+        """
+        Tests getting a named property using the exact key.
+        """
+        named = self._setupNamed()
+        self.assertEqual(named[('8001', constants.ps.PS_MAPI)].namedPropertyID, 0)
+        self.assertEqual(named.get(('8001', constants.ps.PS_MAPI)).namedPropertyID, 0)
+
+    def testCaseInsensitiveLookup(self):
+        """
+        Tests getting a named property using a key of a different case.
+        """
+        named = self._setupNamed()
+        self.assertEqual(named[('keywords', constants.ps.PS_PUBLIC_STRINGS.lower())].namedPropertyID, 1)
+        self.assertIsNone(named.get(('missing', constants.ps.PS_PUBLIC_STRINGS)))
+        with self.assertRaises(KeyError):
+            named[('missing', constants.ps.PS_PUBLIC_STRINGS)]
+
+    def testCaseCollision(self):
+        """
+        Tests that the first key wins when two keys only differ by case.
+        """
+        named = self._setupNamed()
+        self.assertEqual(named[('KEYWORDS', constants.ps.PS_PUBLIC_STRINGS)].namedPropertyID, 1)
+        self.assertEqual(named[('Keywords', constants.ps.PS_PUBLIC_STRINGS)].namedPropertyID, 1)
+
+    def testContains(self):
+        """
+        Tests that the in operator matches keys the same way as lookups.
+        """
+        named = self._setupNamed()
+        self.assertIn(('8001', constants.ps.PS_MAPI), named)
+        self.assertIn(('keywords', constants.ps.PS_PUBLIC_STRINGS.lower()), named)
+        self.assertIn(('8002', None), named)
+        self.assertNotIn(('missing', constants.ps.PS_PUBLIC_STRINGS), named)
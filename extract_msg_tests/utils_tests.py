@@ -0,0 +1,59 @@
+__all__ = [
+    'CachedPropertyTests',
+]
+
+
+import functools
+import unittest
+
+from extract_msg.utils import _cachedProperty
+
+
+class _Counter:
+    def __init__(self):
+        self.calls = 0
+
+    @_cachedProperty
+    def value(self) -> int:
+        """
+        Docstring for the value.
+        """
+        self.calls += 1
+        return self.calls
+
+
+class CachedPropertyTests(unittest.TestCase):
+    def testGetterRunsOnce(self):
+        """
+        Tests that the getter only runs on the first access.
+        """
+        counter = _Counter()
+        self.assertEqual(counter.value, 1)
+        self.assertEqual(counter.value, 1)
+        self.assertEqual(counter.calls, 1)
+
+        # Each instance has its own value.
+        self.assertEqual(_Counter().value, 1)
+
+    def testStoredInInstanceDict(self):
+        """
+        Tests that the value is written to the instance __dict__ under the name
+        of the property.
+        """
+        counter = _Counter()
+        self.assertNotIn('value', counter.__dict__)
+        counter.value
+        self.assertEqual(counter.__dict__['value'], 1)
+
+        # Removing the cached value causes it to be recomputed.
+        del counter.value
+        self.assertEqual(counter.value, 2)
+
+    def testClassAccess(self):
+        """
+        Tests that accessing the property on the class returns the descriptor.
+        """
+        descriptor = _Counter.value
+        self.assertIsInstance(descriptor, _cachedProperty)
+        self.assertIsInstance(descriptor, functools.cached_property)
+        self.assertEqual(descriptor.__doc__.strip(), 'Docstring for the value.')